@@ -3,19 +3,65 @@ import csv
 import re
 import datetime
 import io
-from collections import Counter
+import functools
+import itertools
+
+try:
+    import ijson  # optional: incremental parsing of JSON file objects
+except ImportError:
+    ijson = None
+
+try:
+    import orjson  # optional: faster parsing of in-memory JSON
+except ImportError:
+    orjson = None
+
+# orjson silently turns integers outside 64 bits into floats, so documents with a run
+# of 19 or more digits (which may hold such an integer) go to the stdlib parser
+_LONG_DIGITS_RE = re.compile(r"[0-9]{19}")
+_LONG_DIGITS_BYTES_RE = re.compile(rb"[0-9]{19}")
+
+def _json_loads(json_str):
+    """Parse a JSON document, using orjson only where it matches json.loads exactly."""
+    if orjson is not None:
+        if isinstance(json_str, str):
+            long_digits = _LONG_DIGITS_RE.search(json_str)
+        elif isinstance(json_str, (bytes, bytearray)):
+            long_digits = _LONG_DIGITS_BYTES_RE.search(json_str)
+        else:
+            long_digits = True
+        if not long_digits:
+            try:
+                return orjson.loads(json_str)
+            except orjson.JSONDecodeError:
+                # orjson rejects some input the stdlib accepts (NaN, Infinity, 1e400,
+                # lone surrogates); let json.loads decide
+                pass
+    return json.loads(json_str)
+
+_EXPECTED_KEYWORDS = ("growth", "risk", "innovation", "market", "confidence", 
+                      "investment", "strategic", "opportunity", "challenges", "expansion")
 
 class InvestorBriefingExtractor:
+    # Class-level tuple; subclasses or instances may override it with any sequence
+    expected_keywords = _EXPECTED_KEYWORDS
+    
+    # Maximal runs of word characters, i.e. exactly the spans a \bkeyword\b match can cover
+    _WORD_RE = re.compile(r"\w+")
+    _REQUIRED_FIELDS = ("briefing_id", "date", "briefing_text")
+    _DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+    
     def __init__(self):
-        self.expected_keywords = ["growth", "risk", "innovation", "market", "confidence", 
-                                  "investment", "strategic", "opportunity", "challenges", "expansion"]
+        # Floats parsed from string key_metrics by the last validate_data call, keyed by
+        # the raw string, so processing can reuse them without touching the records
+        self._parsed_key_metrics = {}
         
     def validate_data(self, data_str, data_format="json"):
         """
         Validates the input data based on the specified format.
         
         Args:
-            data_str (str): The input data string.
+            data_str (str or file): The input data string, or a readable file object.
             data_format (str): The format of the input data ("json" or "csv").
             
         Returns:
@@ -23,46 +69,64 @@ class InvestorBriefingExtractor:
         """
         records = []
         error_messages = []
+        self._parsed_key_metrics = parsed_key_metrics = {}
         
         try:
-            if data_format.lower() == "json":
-                records = self._parse_json(data_str)
-            elif data_format.lower() == "csv":
-                records = self._parse_csv(data_str)
-            else:
+            parser = {"json": self._parse_json, "csv": self._parse_csv}.get(data_format.lower())
+            if parser is None:
                 return False, [], "ERROR: Invalid data format. Please provide data in CSV or JSON format.", []
+            records = parser(data_str)
             
-            # Validate each record
+            # Validate each record, checking every field once; the report is formatted from these statuses
+            record_statuses = []
             for i, record in enumerate(records, 1):
-                # Check for required fields
-                missing_fields = []
-                for field in ["briefing_id", "date", "briefing_text"]:
-                    if field not in record or not record[field]:
-                        missing_fields.append(field)
+                briefing_id = record.get("briefing_id")
+                date = record.get("date")
+                briefing_text = record.get("briefing_text")
+                date_valid = bool(date) and self._is_valid_date(date)
+                
+                # Check key_metrics if provided
+                key_metrics_status = "**not provided**"
+                key_metrics_error = None
+                raw_key_metrics = record.get("key_metrics")
+                if raw_key_metrics:
+                    try:
+                        key_metrics = float(raw_key_metrics)
+                        # Keep the parsed value so processing does not convert it again
+                        if isinstance(raw_key_metrics, str):
+                            parsed_key_metrics[raw_key_metrics] = key_metrics
+                        key_metrics_status = "**valid**" if key_metrics > 0 else "**invalid**"
+                        if key_metrics <= 0:
+                            key_metrics_error = f"ERROR: Invalid value for the field(s): key_metrics in record {i}. Must be a positive number."
+                    except ValueError:
+                        key_metrics_status = "**invalid**"
+                        key_metrics_error = f"ERROR: Invalid data type for the field(s): key_metrics in record {i}. Please ensure numeric values."
                 
+                record_statuses.append((
+                    "**present**" if briefing_id else "**missing**",
+                    "**valid**" if date_valid else "**invalid**",
+                    "**present**" if briefing_text else "**missing**",
+                    key_metrics_status,
+                ))
+                
+                # Check for required fields
+                missing_fields = [field for field, value in zip(self._REQUIRED_FIELDS, (briefing_id, date, briefing_text)) if not value]
                 if missing_fields:
                     error_msg = f"ERROR: Missing required field(s): {', '.join(missing_fields)} in record {i}."
                     error_messages.append(error_msg)
                     continue
                 
                 # Validate date format
-                if not self._is_valid_date(record["date"]):
+                if not date_valid:
                     error_msg = f"ERROR: Invalid value for the field(s): date in record {i}. Please correct and resubmit."
                     error_messages.append(error_msg)
                 
                 # Validate key_metrics if provided
-                if "key_metrics" in record and record["key_metrics"]:
-                    try:
-                        key_metrics = float(record["key_metrics"])
-                        if key_metrics <= 0:
-                            error_msg = f"ERROR: Invalid value for the field(s): key_metrics in record {i}. Must be a positive number."
-                            error_messages.append(error_msg)
-                    except ValueError:
-                        error_msg = f"ERROR: Invalid data type for the field(s): key_metrics in record {i}. Please ensure numeric values."
-                        error_messages.append(error_msg)
+                if key_metrics_error:
+                    error_messages.append(key_metrics_error)
             
             # Generate validation report
-            validation_report = self._generate_validation_report(records, error_messages)
+            validation_report = self._generate_validation_report(record_statuses, error_messages)
             return len(error_messages) == 0, records, validation_report, error_messages
             
         except Exception as e:
@@ -70,10 +134,15 @@ class InvestorBriefingExtractor:
             return False, [], error_msg, [error_msg]
     
     def _parse_json(self, json_str):
-        """Parse JSON data and return a list of records."""
+        """Parse JSON data (a string or a file object) and return a list of records."""
+        if hasattr(json_str, "read"):
+            # Binary streams are parsed incrementally so the raw text is never buffered whole
+            if ijson is not None and isinstance(json_str.read(0), bytes):
+                return self._parse_json_stream(json_str)
+            json_str = json_str.read()
         try:
-            data = json.loads(json_str)
-            if "briefings" in data and isinstance(data["briefings"], list):
+            data = _json_loads(json_str)
+            if isinstance(data, dict) and isinstance(data.get("briefings"), list):
                 return data["briefings"]
             elif isinstance(data, list):
                 return data
@@ -82,21 +151,54 @@ class InvestorBriefingExtractor:
         except json.JSONDecodeError:
             raise ValueError("Invalid JSON format. Please check your data.")
     
+    def _parse_json_stream(self, stream):
+        """
+        Parse a binary JSON stream with ijson and return a list of records.
+        
+        yajl rejects some documents the stdlib accepts: integers outside 64 bits, NaN,
+        Infinity, out-of-range floats and escaped lone low surrogates. Seekable streams
+        are re-read and parsed whole in that case, so they give the same result as str
+        input; non-seekable streams report them as invalid JSON. An escaped lone high
+        surrogate is decoded by yajl as "?" rather than rejected.
+        """
+        seekable = getattr(stream, "seekable", None)
+        start = stream.tell() if seekable is not None and seekable() else None
+        try:
+            events = ijson.parse(stream, use_float=True)
+            first = next(events, None)
+            if first is not None:
+                events = itertools.chain([first], events)
+                if first[1] == "start_array":
+                    return list(ijson.items(events, "item"))
+                # Drain the whole document so syntax errors anywhere still raise, and let
+                # the last 'briefings' key win, as json.loads does
+                briefings = None
+                for briefings in ijson.items(events, "briefings"):
+                    pass
+                if first[1] == "start_map" and isinstance(briefings, list):
+                    return briefings
+        except (ijson.JSONError, UnicodeDecodeError):
+            if start is None:
+                raise ValueError("Invalid JSON format. Please check your data.")
+            # Genuinely malformed input fails the same way in the string parser
+            stream.seek(start)
+            return self._parse_json(stream.read())
+        raise ValueError("Invalid JSON structure. Expected a list of briefings or a 'briefings' field containing a list.")
+    
     def _parse_csv(self, csv_str):
-        """Parse CSV data and return a list of records."""
+        """Parse CSV data (a string or a text file object) and return a list of records."""
         try:
-            records = []
-            csv_reader = csv.DictReader(io.StringIO(csv_str))
-            for row in csv_reader:
-                records.append(dict(row))
-            return records
+            # DictReader already yields a fresh dict per row, so no per-row copy is needed
+            csv_reader = csv.DictReader(csv_str if hasattr(csv_str, "read") else io.StringIO(csv_str))
+            return list(csv_reader)
         except Exception:
             raise ValueError("Invalid CSV format. Please check your data.")
     
-    def _is_valid_date(self, date_str):
-        """Check if the date string is in YYYY-MM-DD format."""
-        pattern = r"^\d{4}-\d{2}-\d{2}$"
-        if not re.match(pattern, date_str):
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _is_valid_date(date_str):
+        """Check if the date string is in YYYY-MM-DD format (memoized, as briefings often share dates)."""
+        if not InvestorBriefingExtractor._DATE_RE.match(date_str):
             return False
         
         try:
@@ -105,51 +207,48 @@ class InvestorBriefingExtractor:
         except ValueError:
             return False
     
-    def _generate_validation_report(self, records, error_messages):
-        """Generate a validation report in markdown format."""
-        report = "# Investor Briefing Data Validation Report\n"
-        report += "## Overview\n"
-        report += f"- Total Briefings Provided: {len(records)}\n"
-        report += "## Field Checks per Record\n"
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _keyword_index(keywords):
+        """Build the keyword -> slot mapping and any per-keyword regexes (memoized per keyword tuple)."""
+        # The mapping lets hits be tallied into a plain list and also serves as the membership test
+        keyword_ids = {keyword: i for i, keyword in enumerate(keywords)}
+        # The token scan only sees single \w+ runs; keywords such as "long-term" or
+        # "market share" are counted with one \bkeyword\b regex each instead
+        keyword_patterns = None
+        if not all(InvestorBriefingExtractor._WORD_RE.fullmatch(keyword) for keyword in keywords):
+            keyword_patterns = [(idx, re.compile(r'\b' + re.escape(keyword) + r'\b')) for keyword, idx in keyword_ids.items()]
+        return keyword_ids, keyword_patterns
+    
+    def _generate_validation_report(self, record_statuses, error_messages):
+        """Generate a validation report in markdown format from the per-record field statuses."""
+        report = io.StringIO()
+        report.write("# Investor Briefing Data Validation Report\n")
+        report.write("## Overview\n")
+        report.write(f"- Total Briefings Provided: {len(record_statuses)}\n")
+        report.write("## Field Checks per Record\n")
         
         all_valid = True
-        for i, record in enumerate(records, 1):
-            report += f"\n### Record {i}\n"
-            # Check briefing_id
-            briefing_id_status = "**present**" if "briefing_id" in record and record["briefing_id"] else "**missing**"
-            report += f"- briefing_id: {briefing_id_status}\n"
-            
-            # Check date
-            date_status = "**valid**" if "date" in record and self._is_valid_date(record["date"]) else "**invalid**"
-            report += f"- date: {date_status}\n"
-            
-            # Check briefing_text
-            briefing_text_status = "**present**" if "briefing_text" in record and record["briefing_text"] else "**missing**"
-            report += f"- briefing_text: {briefing_text_status}\n"
-            
-            # Check key_metrics
-            key_metrics_status = "**not provided**"
-            if "key_metrics" in record and record["key_metrics"]:
-                try:
-                    key_metrics = float(record["key_metrics"])
-                    key_metrics_status = "**valid**" if key_metrics > 0 else "**invalid**"
-                except ValueError:
-                    key_metrics_status = "**invalid**"
-            report += f"- key_metrics: {key_metrics_status}\n"
+        for i, (briefing_id_status, date_status, briefing_text_status, key_metrics_status) in enumerate(record_statuses, 1):
+            report.write(f"\n### Record {i}\n")
+            report.write(f"- briefing_id: {briefing_id_status}\n")
+            report.write(f"- date: {date_status}\n")
+            report.write(f"- briefing_text: {briefing_text_status}\n")
+            report.write(f"- key_metrics: {key_metrics_status}\n")
             
             # Update all_valid flag
             if "**missing**" in [briefing_id_status, briefing_text_status] or "**invalid**" in [date_status, key_metrics_status]:
                 all_valid = False
         
-        report += "\n## Summary\n"
+        report.write("\n## Summary\n")
         if all_valid and not error_messages:
-            report += "Data validation is successful! Would you like to proceed with theme extraction?\n"
+            report.write("Data validation is successful! Would you like to proceed with theme extraction?\n")
         else:
-            report += "The following errors were found:\n"
+            report.write("The following errors were found:\n")
             for error in error_messages:
-                report += f"- {error}\n"
+                report.write(f"- {error}\n")
         
-        return report
+        return report.getvalue()
     
     def process_briefings(self, records):
         """
@@ -161,50 +260,83 @@ class InvestorBriefingExtractor:
         Returns:
             str: The formatted final report in markdown.
         """
-        results = []
-        records_with_key_metrics = [r for r in records if "key_metrics" in r and r["key_metrics"]]
+        # Running sum/count of the provided key_metrics, without an intermediate list
+        sum_key_metrics = 0.0
+        key_metrics_count = 0
+        for record in records:
+            key_metrics = self._get_key_metrics(record)
+            if key_metrics is not None:
+                sum_key_metrics += key_metrics
+                key_metrics_count += 1
         
-        avg_key_metric = 0
-        if records_with_key_metrics:
-            sum_key_metrics = sum(float(r["key_metrics"]) for r in records_with_key_metrics)
-            avg_key_metric = sum_key_metrics / len(records_with_key_metrics)
+        avg_key_metric = sum_key_metrics / key_metrics_count if key_metrics_count else 0
         
-        for record in records:
-            # Process each record
-            result = self._process_single_briefing(record, avg_key_metric)
-            results.append(result)
+        # Snapshot the keywords once per run (a no-op for the default tuple)
+        keywords = tuple(self.expected_keywords)
+        keyword_ids, keyword_patterns = self._keyword_index(keywords)
         
-        # Generate the final report
-        final_report = self._generate_final_report(results)
+        # Each briefing is formatted as soon as it is processed, so the per-record
+        # result dicts are never held in memory together
+        results = (self._process_single_briefing(record, avg_key_metric, keywords, keyword_ids, keyword_patterns) for record in records)
+        
+        # Generate the final report; the keyword list line is the same for every briefing
+        final_report = self._generate_final_report(results, ", ".join(keywords))
         return final_report
     
-    def _process_single_briefing(self, record, avg_key_metric):
+    def _get_key_metrics(self, record):
+        """Return a record's key_metrics as a float, or None if not provided."""
+        raw_key_metrics = record.get("key_metrics")
+        if not raw_key_metrics:
+            return None
+        # Cached by raw value, so an edited record is simply parsed afresh
+        if isinstance(raw_key_metrics, str):
+            key_metrics = self._parsed_key_metrics.get(raw_key_metrics)
+            if key_metrics is not None:
+                return key_metrics
+        return float(raw_key_metrics)
+    
+    def _process_single_briefing(self, record, avg_key_metric, keywords, keyword_ids, keyword_patterns=None):
         """Process a single briefing record and return the analysis results."""
         briefing_id = record["briefing_id"]
         date = record["date"]
         briefing_text = record["briefing_text"]
-        key_metrics = float(record["key_metrics"]) if "key_metrics" in record and record["key_metrics"] else None
+        key_metrics = self._get_key_metrics(record)
         
         # Calculate keyword frequencies
-        word_count = len(briefing_text.split())
-        keyword_counts = Counter()
+        counts = [0] * len(keywords)
         
-        # Count occurrences of each expected keyword in the text (case-insensitive)
-        for keyword in self.expected_keywords:
-            pattern = r'\b' + re.escape(keyword) + r'\b'
-            matches = re.finditer(pattern, briefing_text.lower())
-            count = sum(1 for _ in matches)
-            keyword_counts[keyword] = count
+        # Count words and keyword occurrences (case-insensitive) in one pass over the
+        # whitespace tokens. A token made only of word characters is a single \b...\b
+        # span; anything else (punctuation, hyphens) is split into its \w+ runs.
+        tokens = briefing_text.split()
+        word_count = len(tokens)
+        if keyword_patterns is not None:
+            lowered_text = briefing_text.lower()
+            for idx, pattern in keyword_patterns:
+                counts[idx] = len(pattern.findall(lowered_text))
+        else:
+            for token in tokens:
+                # Lowercase before splitting into \w+ runs, as the original scan lowercased
+                # the whole text first (e.g. "İ" lowercases to "i" plus a combining mark)
+                token = token.lower()
+                idx = keyword_ids.get(token)
+                if idx is not None:
+                    counts[idx] += 1
+                elif not token.isalnum():
+                    for word in self._WORD_RE.findall(token):
+                        idx = keyword_ids.get(word)
+                        if idx is not None:
+                            counts[idx] += 1
         
         # Calculate total keyword frequency
-        total_keyword_frequency = sum(keyword_counts.values())
+        total_keyword_frequency = sum(counts)
         
         # Calculate Normalized Keyword Score
         normalized_keyword_score = total_keyword_frequency / word_count if word_count > 0 else 0
         
         # Calculate Diversity Score
-        unique_keywords_found = sum(1 for keyword, count in keyword_counts.items() if count > 0)
-        diversity_score = (unique_keywords_found / len(self.expected_keywords)) * 100
+        unique_keywords_found = len(counts) - counts.count(0)
+        diversity_score = (unique_keywords_found / len(keywords)) * 100
         
         # Calculate Composite Thematic Score
         composite_thematic_score = (normalized_keyword_score * 50) + (diversity_score * 0.5)
@@ -224,7 +356,7 @@ class InvestorBriefingExtractor:
             "briefing_text_snippet": briefing_text[:100] + "..." if len(briefing_text) > 100 else briefing_text,
             "key_metrics": key_metrics,
             "avg_key_metric": avg_key_metric,
-            "keyword_counts": dict(keyword_counts),
+            "keyword_counts": dict(zip(keywords, counts)),
             "total_keyword_frequency": total_keyword_frequency,
             "word_count": word_count,
             "normalized_keyword_score": normalized_keyword_score,
@@ -237,77 +369,82 @@ class InvestorBriefingExtractor:
         
         return result
     
-    def _generate_final_report(self, results):
-        """Generate the final report in markdown format."""
-        report = "# Investor Briefing Summary\n"
-        report += f"## Total Briefings Evaluated: {len(results)}\n\n"
-        report += "### Detailed Analysis per Briefing:\n"
+    def _generate_final_report(self, results, keywords_csv):
+        """Generate the final report in markdown format, consuming results one at a time."""
+        details = io.StringIO()
+        recommendations = io.StringIO()
+        total = 0
         
         for result in results:
-            report += f"#### Briefing {result['briefing_id']}\n"
-            report += "**Input Data:**\n"
-            report += f"- Date: {result['date']}\n"
-            report += f"- Briefing Text Snippet: {result['briefing_text_snippet']}\n"
+            total += 1
+            details.write(f"#### Briefing {result['briefing_id']}\n")
+            details.write("**Input Data:**\n")
+            details.write(f"- Date: {result['date']}\n")
+            details.write(f"- Briefing Text Snippet: {result['briefing_text_snippet']}\n")
             
             if result['key_metrics'] is not None:
-                report += f"- Key Metrics: {result['key_metrics']:.2f}\n"
+                details.write(f"- Key Metrics: {result['key_metrics']:.2f}\n")
             else:
-                report += "- Key Metrics: Not provided\n"
+                details.write("- Key Metrics: Not provided\n")
             
-            report += "\n**Detailed Calculations:**\n"
+            details.write("\n**Detailed Calculations:**\n")
             
             # 1. Average Key Metric Calculation
-            report += "1. **Average Key Metric Calculation:**\n"
-            report += " - Formula: $$ \\text{Average Key Metric} = \\frac{\\text{Sum of key\\_metrics}}{\\text{Number of records with key\\_metrics}} $$\n"
+            details.write("1. **Average Key Metric Calculation:**\n")
+            details.write(" - Formula: $$ \\text{Average Key Metric} = \\frac{\\text{Sum of key\\_metrics}}{\\text{Number of records with key\\_metrics}} $$\n")
             
             if result['key_metrics'] is not None:
-                report += f" - Calculation Steps: Sum of key_metrics / Number of records = {result['avg_key_metric']:.2f}\n"
+                details.write(f" - Calculation Steps: Sum of key_metrics / Number of records = {result['avg_key_metric']:.2f}\n")
             else:
-                report += " - Calculation Steps: No key_metrics provided for this record\n"
+                details.write(" - Calculation Steps: No key_metrics provided for this record\n")
             
-            report += f" - Result: **{result['avg_key_metric']:.2f}**\n"
+            details.write(f" - Result: **{result['avg_key_metric']:.2f}**\n")
             
             # 2. Keyword Frequency Calculation
-            report += "2. **Keyword Frequency Calculation:**\n"
-            report += f" - Expected Keywords: \"{', '.join(self.expected_keywords)}\"\n"
-            report += " - Keyword Occurrences:\n"
+            details.write("2. **Keyword Frequency Calculation:**\n")
+            details.write(f" - Expected Keywords: \"{keywords_csv}\"\n")
+            details.write(" - Keyword Occurrences:\n")
             
             for keyword, count in result['keyword_counts'].items():
-                report += f"   - \"{keyword}\": {count}\n"
+                details.write(f"   - \"{keyword}\": {count}\n")
             
-            report += f" - Total Keyword Frequency: **{result['total_keyword_frequency']}**\n"
+            details.write(f" - Total Keyword Frequency: **{result['total_keyword_frequency']}**\n")
             
             # 3. Normalized Keyword Score Calculation
-            report += "3. **Normalized Keyword Score Calculation:**\n"
-            report += " - Formula: $$ \\text{Normalized Keyword Score} = \\frac{\\text{Total Keyword Frequency}}{\\text{Total Number of Words}} $$\n"
-            report += f" - Calculation Steps: {result['total_keyword_frequency']} / {result['word_count']} = {result['normalized_keyword_score']:.4f}\n"
-            report += f" - Result: **{result['normalized_keyword_score']:.4f}**\n"
+            details.write("3. **Normalized Keyword Score Calculation:**\n")
+            details.write(" - Formula: $$ \\text{Normalized Keyword Score} = \\frac{\\text{Total Keyword Frequency}}{\\text{Total Number of Words}} $$\n")
+            details.write(f" - Calculation Steps: {result['total_keyword_frequency']} / {result['word_count']} = {result['normalized_keyword_score']:.4f}\n")
+            details.write(f" - Result: **{result['normalized_keyword_score']:.4f}**\n")
             
             # 4. Diversity Score Calculation
-            report += "4. **Diversity Score Calculation:**\n"
-            report += " - Formula: $$ \\text{Diversity Score} = \\frac{\\text{Number of Unique Keywords Found}}{10} \\times 100 $$\n"
-            report += f" - Calculation Steps: ({result['unique_keywords_found']} / 10) × 100 = {result['diversity_score']:.2f}%\n"
-            report += f" - Result: **{result['diversity_score']:.2f}%**\n"
+            details.write("4. **Diversity Score Calculation:**\n")
+            details.write(" - Formula: $$ \\text{Diversity Score} = \\frac{\\text{Number of Unique Keywords Found}}{10} \\times 100 $$\n")
+            details.write(f" - Calculation Steps: ({result['unique_keywords_found']} / 10) × 100 = {result['diversity_score']:.2f}%\n")
+            details.write(f" - Result: **{result['diversity_score']:.2f}%**\n")
             
             # 5. Composite Thematic Score Calculation
-            report += "5. **Composite Thematic Score Calculation:**\n"
-            report += " - Formula: $$ \\text{Composite Thematic Score} = (\\text{Normalized Keyword Score} \\times 50) + (\\text{Diversity Score} \\times 0.5) $$\n"
-            report += f" - Calculation Steps: ({result['normalized_keyword_score']:.4f} × 50) + ({result['diversity_score']:.2f} × 0.5) = {result['normalized_keyword_score']*50:.2f} + {result['diversity_score']*0.5:.2f} = {result['composite_thematic_score']:.2f}\n"
-            report += f" - Result: **{result['composite_thematic_score']:.2f}**\n\n"
-        
-        # Compile the final recommendations
-        report += "### Final Recommendation:\n"
-        for i, result in enumerate(results, 1):
-            report += f"#### Briefing {result['briefing_id']}:\n"
-            report += f"- **Composite Thematic Score:** {result['composite_thematic_score']:.2f}\n"
-            report += f"- **Normalized Keyword Score:** {result['normalized_keyword_score']:.4f}\n"
-            report += f"- **Thematic Intensity:** {result['thematic_intensity']}\n"
-            report += f"- **Recommended Action:** {result['recommendation']}\n\n"
-        
-        report += "### Feedback and Rating:\n"
-        report += "Please rate the quality of this summary on a scale of 1 to 5 and provide any remarks for improvement.\n"
+            details.write("5. **Composite Thematic Score Calculation:**\n")
+            details.write(" - Formula: $$ \\text{Composite Thematic Score} = (\\text{Normalized Keyword Score} \\times 50) + (\\text{Diversity Score} \\times 0.5) $$\n")
+            details.write(f" - Calculation Steps: ({result['normalized_keyword_score']:.4f} × 50) + ({result['diversity_score']:.2f} × 0.5) = {result['normalized_keyword_score']*50:.2f} + {result['diversity_score']*0.5:.2f} = {result['composite_thematic_score']:.2f}\n")
+            details.write(f" - Result: **{result['composite_thematic_score']:.2f}**\n\n")
+            
+            # Compile the final recommendation for this briefing
+            recommendations.write(f"#### Briefing {result['briefing_id']}:\n")
+            recommendations.write(f"- **Composite Thematic Score:** {result['composite_thematic_score']:.2f}\n")
+            recommendations.write(f"- **Normalized Keyword Score:** {result['normalized_keyword_score']:.4f}\n")
+            recommendations.write(f"- **Thematic Intensity:** {result['thematic_intensity']}\n")
+            recommendations.write(f"- **Recommended Action:** {result['recommendation']}\n\n")
         
-        return report
+        return "".join((
+            "# Investor Briefing Summary\n",
+            f"## Total Briefings Evaluated: {total}\n\n",
+            "### Detailed Analysis per Briefing:\n",
+            details.getvalue(),
+            "### Final Recommendation:\n",
+            recommendations.getvalue(),
+            "### Feedback and Rating:\n",
+            "Please rate the quality of this summary on a scale of 1 to 5 and provide any remarks for improvement.\n",
+        ))
 
 def main():
     """Example usage of the InvestorBriefingExtractor class."""
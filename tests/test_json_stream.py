@@ -0,0 +1,85 @@
+import importlib.util
+import io
+import pathlib
+import unittest
+
+_MODULE_PATH = pathlib.Path(__file__).resolve().parent.parent / "InvestorBriefingExtractor-AI.py"
+_spec = importlib.util.spec_from_file_location("investor_briefing_extractor", _MODULE_PATH)
+extractor_module = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(extractor_module)
+
+RECORD = '{"briefing_id": "B1", "date": "2023-01-01", "briefing_text": "growth", "key_metrics": 5}'
+
+DOCUMENTS = [
+    '{"briefings": [%s]}' % RECORD,
+    '[%s]' % RECORD,
+    '{"briefings": [%s], "oops": }' % RECORD,
+    '{"briefings": [%s]} ,garbage' % RECORD,
+    '[%s] garbage' % RECORD,
+    '{"briefings": [%s], "briefings": []}' % RECORD,
+    '{"briefings": [], "briefings": [%s]}' % RECORD,
+    '{"briefings": [%s], "briefings": 3}' % RECORD,
+    '{"other": []}',
+    '"briefings"',
+    '',
+    '[{"briefing_id": 20230711000000000001, "date": "2023-01-01", "briefing_text": "growth"}]',
+    '[{"briefing_id": "B1", "date": "2023-01-01", "briefing_text": "growth", "key_metrics": NaN}]',
+    '[{"briefing_id": "B1", "date": "2023-01-01", "briefing_text": "growth", "key_metrics": Infinity}]',
+    '[{"briefing_id": "B1", "date": "2023-01-01", "briefing_text": "growth", "key_metrics": 1e400}]',
+    '[{"briefing_id": "B\\udc00", "date": "2023-01-01", "briefing_text": "growth"}]',
+]
+
+BIG_INT_DOCUMENT = DOCUMENTS[-5]
+HIGH_SURROGATE_DOCUMENT = '[{"briefing_id": "B\\ud800", "date": "2023-01-01", "briefing_text": "growth"}]'
+
+
+class NonSeekableStream(io.RawIOBase):
+    """A read-only binary stream that cannot be rewound, like a pipe."""
+
+    def __init__(self, data):
+        self._buffer = io.BytesIO(data)
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        return self._buffer.readinto(b)
+
+
+@unittest.skipIf(extractor_module.ijson is None, "ijson is not installed")
+class BinaryStreamTest(unittest.TestCase):
+    def test_binary_stream_matches_string_input(self):
+        extractor = extractor_module.InvestorBriefingExtractor()
+        for document in DOCUMENTS:
+            with self.subTest(document=document):
+                from_string = extractor.validate_data(document, "json")
+                from_stream = extractor.validate_data(io.BytesIO(document.encode()), "json")
+                # repr so that NaN values compare equal
+                self.assertEqual(repr(from_stream), repr(from_string))
+
+    def test_non_seekable_stream_rejects_numbers_yajl_cannot_represent(self):
+        extractor = extractor_module.InvestorBriefingExtractor()
+        is_valid, records, report, errors = extractor.validate_data(NonSeekableStream(BIG_INT_DOCUMENT.encode()), "json")
+        self.assertFalse(is_valid)
+        self.assertEqual(errors, ["ERROR: Invalid JSON format. Please check your data."])
+
+    def test_lone_high_surrogate_is_replaced_in_streams(self):
+        extractor = extractor_module.InvestorBriefingExtractor()
+        records = extractor.validate_data(io.BytesIO(HIGH_SURROGATE_DOCUMENT.encode()), "json")[1]
+        self.assertEqual(records[0]["briefing_id"], "B?")
+
+
+class StringInputTest(unittest.TestCase):
+    def test_integers_beyond_64_bits_stay_exact(self):
+        extractor = extractor_module.InvestorBriefingExtractor()
+        records = extractor.validate_data(BIG_INT_DOCUMENT, "json")[1]
+        self.assertEqual(records[0]["briefing_id"], 20230711000000000001)
+
+    def test_lone_high_surrogate_is_kept_in_strings(self):
+        extractor = extractor_module.InvestorBriefingExtractor()
+        records = extractor.validate_data(HIGH_SURROGATE_DOCUMENT, "json")[1]
+        self.assertEqual(records[0]["briefing_id"], "B\ud800")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import importlib.util
+import pathlib
+import re
+import unittest
+
+_MODULE_PATH = pathlib.Path(__file__).resolve().parent.parent / "InvestorBriefingExtractor-AI.py"
+_spec = importlib.util.spec_from_file_location("investor_briefing_extractor", _MODULE_PATH)
+extractor_module = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(extractor_module)
+
+_OCCURRENCE_RE = re.compile(r'^   - "(.*)": (\d+)$', re.M)
+_WORDS_RE = re.compile(r"^ - Calculation Steps: (\d+) / (\d+) = ", re.M)
+
+TEXTS = [
+    "The company shows significant growth driven by innovative solutions.",
+    "GROWTH. Growth, growth! growthy regrowth growth_ growth2 2growth (growth)",
+    "Risk-adjusted long-term market-share growth; the market's risk, risk.",
+    "Long-term, market share growth. long-term risk risk",
+    "Market\tshare\nmarket  share market-share",
+    "\u0130risk ris\u0130k KRISK \u1e9egrowth",
+    "Opportunity challenges expansion confidence investment strategic innovation",
+    "   ",
+    "",
+]
+
+KEYWORD_SETS = [
+    None,
+    ["long-term", "market share", "growth"],
+    ["market", "market share", "share"],
+    ["growth", "Growth", "risk", "growth"],
+    ["risk", "growth", "risk"],
+]
+
+
+def reference_counts(text, keywords):
+    """Keyword counts as computed by the original per-keyword \\b regex scan."""
+    counts = {}
+    for keyword in keywords:
+        pattern = r"\b" + re.escape(keyword) + r"\b"
+        counts[keyword] = sum(1 for _ in re.finditer(pattern, text.lower()))
+    return counts
+
+
+class KeywordCountTest(unittest.TestCase):
+    def test_counts_match_per_keyword_regex(self):
+        for keywords in KEYWORD_SETS:
+            extractor = extractor_module.InvestorBriefingExtractor()
+            if keywords is not None:
+                extractor.expected_keywords = keywords
+            for text in TEXTS:
+                with self.subTest(keywords=keywords, text=text):
+                    record = {"briefing_id": "B1", "date": "2023-01-01", "briefing_text": text}
+                    report = extractor.process_briefings([record])
+                    expected = reference_counts(text, extractor.expected_keywords)
+                    counts = {keyword: int(count) for keyword, count in _OCCURRENCE_RE.findall(report)}
+                    self.assertEqual(counts, expected)
+                    total, word_count = _WORDS_RE.search(report).groups()
+                    self.assertEqual(int(total), sum(expected.values()))
+                    self.assertEqual(int(word_count), len(text.split()))
+
+
+if __name__ == "__main__":
+    unittest.main()